@@ -43,8 +43,7 @@ def main():
 
     print(f"\nSampled {len(df)} total locations")
     print("\nSamples per city:")
-    for city in df["city"].unique():
-        count = len(df[df["city"] == city])
+    for city, count in df.groupby("city", sort=False).size().items():
         print(f"  {city}: {count}")
 
     print(f"\nOutput: {OUTPUT_PATH}")
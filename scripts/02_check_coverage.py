@@ -12,18 +12,20 @@ Input:
     data/samples/locations.csv
 
 Output:
-    data/coverage/coverage.csv
+    data/coverage/coverage.parquet
 """
 
 from pathlib import Path
 
 import pandas as pd
 
-from gsview.downloader import check_coverage_batch, print_coverage_stats
+from gsview.downloader import CSV_DTYPES, check_coverage_batch, print_coverage_stats
 
 DATA_DIR = Path("data")
 INPUT_PATH = DATA_DIR / "samples" / "locations.csv"
-OUTPUT_PATH = DATA_DIR / "coverage" / "coverage.csv"
+OUTPUT_PATH = DATA_DIR / "coverage" / "coverage.parquet"
+
+INPUT_COLUMNS = ["location_id", "city", "lat", "lon"]
 
 
 def main():
@@ -31,7 +33,7 @@ def main():
         print(f"Error: {INPUT_PATH} not found. Run 01_sample_locations.py first.")
         return
 
-    locations = pd.read_csv(INPUT_PATH)
+    locations = pd.read_csv(INPUT_PATH, usecols=INPUT_COLUMNS, dtype=CSV_DTYPES)
     print(f"Checking coverage for {len(locations)} locations...")
     print("(This uses the FREE metadata API)")
 
@@ -9,25 +9,29 @@ Usage:
     python scripts/03_download_images.py
 
 Input:
-    data/coverage/coverage.csv
+    data/coverage/coverage.parquet
 
 Output:
     data/images/*.jpg
-    data/images/download_results.csv
+    data/images/download_results.parquet
     data/annotation.csv
 """
 
 from pathlib import Path
 
-import pandas as pd
-
-from gsview.downloader import download_images_batch, generate_annotation_csv
+from gsview.downloader import (
+    download_images_batch,
+    generate_annotation_csv,
+    read_table,
+)
 
 DATA_DIR = Path("data")
-COVERAGE_PATH = DATA_DIR / "coverage" / "coverage.csv"
+COVERAGE_PATH = DATA_DIR / "coverage" / "coverage.parquet"
 IMAGES_DIR = DATA_DIR / "images"
 ANNOTATION_PATH = DATA_DIR / "annotation.csv"
 
+LOCATION_COLUMNS = ["location_id", "city", "lat", "lon", "pano_id"]
+
 HEADINGS = [0, 90, 180, 270]
 PITCH = 0
 
@@ -37,8 +41,8 @@ def main():
         print(f"Error: {COVERAGE_PATH} not found. Run 02_check_coverage.py first.")
         return
 
-    coverage_df = pd.read_csv(COVERAGE_PATH)
-    locations = coverage_df[coverage_df["has_coverage"]].copy()
+    coverage_df = read_table(COVERAGE_PATH, columns=LOCATION_COLUMNS + ["has_coverage"])
+    locations = coverage_df.loc[coverage_df["has_coverage"], LOCATION_COLUMNS]
 
     total_images = len(locations) * len(HEADINGS)
     estimated_cost = (total_images / 1000) * 7
@@ -55,6 +59,7 @@ def main():
         return
 
     print("\nDownloading images...")
+    results_path = IMAGES_DIR / "download_results.parquet"
     results = download_images_batch(
         locations,
         output_dir=IMAGES_DIR,
@@ -62,12 +67,10 @@ def main():
         pitch=PITCH,
         rate_limit=0.1,
         skip_existing=True,
+        output_path=results_path,
     )
 
-    results_path = IMAGES_DIR / "download_results.csv"
-    results.to_csv(results_path, index=False)
-
-    successful = results["success"].sum()
+    successful = int(results["success"].to_numpy(dtype=bool).sum())
     failed = len(results) - successful
     print(f"\nDownloaded: {successful} images")
     print(f"Failed: {failed} images")
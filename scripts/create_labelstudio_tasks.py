@@ -2,16 +2,44 @@
 """Create Label Studio tasks JSON from downloaded Street View images."""
 
 import json
+from collections import Counter
 from pathlib import Path
 
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def main():
     data_dir = Path(__file__).parent.parent / "data"
 
-    samples = pd.read_csv(data_dir / "samples" / "random_sample_4500.csv")
-    downloads = pd.read_csv(data_dir / "images" / "random_sample.csv")
+    samples = pd.read_csv(
+        data_dir / "samples" / "random_sample_4500.csv",
+        usecols=["location_id", "segment_id", "osm_name", "osm_type"],
+        dtype={"location_id": str, "osm_name": str, "osm_type": str},
+    )
+    downloads = pd.read_csv(
+        data_dir / "images" / "random_sample.csv",
+        usecols=[
+            "location_id", "city", "lat", "lon", "heading", "pitch",
+            "image_path", "success"
+        ],
+        dtype={
+            "location_id": str, "city": "category", "lat": "float64",
+            "lon": "float64", "image_path": str, "success": "bool"
+        },
+    )
+
+    # Merge on a shared categorical dtype so the join hashes integer codes
+    # rather than location_id strings.
+    location_ids = pd.CategoricalDtype(
+        pd.concat([samples["location_id"], downloads["location_id"]]).unique()
+    )
+    samples["location_id"] = samples["location_id"].astype(location_ids)
+    downloads["location_id"] = downloads["location_id"].astype(location_ids)
 
     merged = downloads.merge(
         samples[["location_id", "segment_id", "osm_name", "osm_type"]],
@@ -19,40 +47,56 @@ def main():
         how="left"
     )
 
-    successful = merged[merged["success"] == True]
+    successful = merged[merged["success"] == True].copy()
+    successful["heading"] = successful["heading"].astype(int)
+    successful["pitch"] = successful["pitch"].astype(int)
+    successful["segment_id"] = (
+        successful["segment_id"].astype("Int64").to_numpy(dtype=object, na_value=None)
+    )
+    successful["osm_name"] = successful["osm_name"].fillna("")
+    successful["osm_type"] = successful["osm_type"].fillna("")
+
+    columns = [
+        "location_id", "city", "lat", "lon", "heading", "pitch",
+        "image_path", "segment_id", "osm_name", "osm_type"
+    ]
 
     tasks = []
-    for _, row in successful.iterrows():
-        image_filename = Path(str(row["image_path"])).name
-        segment_id = row["segment_id"]
-        osm_name = row["osm_name"]
-        osm_type = row["osm_type"]
+    for (
+        location_id, city, lat, lon, heading, pitch,
+        image_path, segment_id, osm_name, osm_type
+    ) in successful[columns].itertuples(index=False, name=None):
+        image_filename = Path(str(image_path)).name
         task = {
             "data": {
                 "image": f"gs://sawasdee-labelstudio/google_streetview/{image_filename}",
-                "location_id": row["location_id"],
-                "city": row["city"],
-                "lat": row["lat"],
-                "lon": row["lon"],
-                "heading": int(row["heading"]),
-                "pitch": int(row["pitch"]),
-                "segment_id": int(segment_id) if pd.notna(segment_id) else None,
-                "osm_name": osm_name if pd.notna(osm_name) else "",
-                "osm_type": osm_type if pd.notna(osm_type) else ""
+                "location_id": location_id,
+                "city": city,
+                "lat": lat,
+                "lon": lon,
+                "heading": heading,
+                "pitch": pitch,
+                "segment_id": segment_id,
+                "osm_name": osm_name,
+                "osm_type": osm_type
             }
         }
         tasks.append(task)
 
     output_path = data_dir / "labelstudio_tasks.json"
-    with open(output_path, "w") as f:
-        json.dump(tasks, f, indent=2)
+    if orjson is not None:
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(tasks, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w") as f:
+            json.dump(tasks, f, indent=2)
 
     print(f"Created {len(tasks)} Label Studio tasks")
     print(f"Output: {output_path}")
 
-    cities = pd.DataFrame([t["data"] for t in tasks]).groupby("city").size()
+    cities = Counter(t["data"]["city"] for t in tasks)
     print(f"\nTasks by city:")
-    for city, count in cities.items():
+    for city, count in sorted(cities.items()):
         print(f"  {city}: {count}")
 
 
@@ -1,14 +1,17 @@
 """Command-line interface for gsview."""
 
 import click
+import numpy as np
 import pandas as pd
 
 from .downloader import (
+    CSV_DTYPES,
     check_coverage_batch,
     download_images_batch,
     download_images_hires_batch,
     generate_annotation_csv,
     print_coverage_stats,
+    read_table,
 )
 from .sampling import plot_samples, sample_all_cities, sample_city
 
@@ -34,23 +37,40 @@ def main():
 )
 @click.option("--seed", type=int, default=42, help="Random seed")
 @click.option("-o", "--output", type=click.Path(), default="data/samples/locations.csv")
-def sample(city, n_samples, seed, output):
+@click.option(
+    "--backend",
+    type=click.Choice(["overpass", "pyrosm"]),
+    default="overpass",
+    help="Road source when downloading road data",
+)
+@click.option(
+    "--pbf",
+    "pbf_path",
+    type=click.Path(exists=True),
+    default=None,
+    help="OSM PBF extract for --backend pyrosm (single city only)",
+)
+def sample(city, n_samples, seed, output, backend, pbf_path):
     """Sample road locations from cities."""
+    if pbf_path and city == "all":
+        raise click.UsageError("--pbf requires a single --city")
+
     click.echo(f"Sampling locations (seed={seed})...")
 
     if city == "all":
-        df = sample_all_cities(seed=seed)
+        df = sample_all_cities(seed=seed, backend=backend)
     else:
-        df = sample_city(city, n_samples=n_samples, seed=seed)
-        df["location_id"] = [f"loc_{i:05d}" for i in range(len(df))]
+        df = sample_city(
+            city, n_samples=n_samples, seed=seed, backend=backend, pbf_path=pbf_path
+        )
+        df["location_id"] = np.char.mod("loc_%05d", np.arange(len(df)))
         df = df[["location_id", "city", "lat", "lon"]]
 
     df.to_csv(output, index=False)
     click.echo(f"Sampled {len(df)} locations")
     click.echo(f"Output: {output}")
 
-    for c in df["city"].unique():
-        count = len(df[df["city"] == c])
+    for c, count in df.groupby("city", sort=False, observed=True).size().items():
         click.echo(f"  {c}: {count}")
 
 
@@ -62,17 +82,42 @@ def sample(city, n_samples, seed, output):
     type=click.Path(exists=True),
     default="data/samples/locations.csv",
 )
-@click.option("-o", "--output", type=click.Path(), default="data/coverage/coverage.csv")
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(),
+    default="data/coverage/coverage.parquet",
+    help="Output path (.parquet or .csv)",
+)
 @click.option("--rate-limit", type=float, default=0.1, help="Seconds between API calls")
-def coverage(input_path, output, rate_limit):
+@click.option(
+    "--max-workers", type=int, default=16, help="Concurrent metadata requests"
+)
+@click.option(
+    "--dedup-radius",
+    type=float,
+    default=10.0,
+    help="Share coverage results between points within this many metres (0=off)",
+)
+@click.option(
+    "--streetlevel",
+    is_flag=True,
+    help="Look up panoramas via streetlevel instead of the metadata API",
+)
+def coverage(input_path, output, rate_limit, max_workers, dedup_radius, streetlevel):
     """Check Street View coverage for sampled locations."""
-    locations = pd.read_csv(input_path)
+    locations = pd.read_csv(
+        input_path, usecols=["location_id", "city", "lat", "lon"], dtype=CSV_DTYPES
+    )
     click.echo(f"Checking coverage for {len(locations)} locations...")
 
     results = check_coverage_batch(
         locations,
         output_path=output,
         rate_limit=rate_limit,
+        max_workers=max_workers,
+        dedup_radius_m=dedup_radius,
+        use_streetlevel=streetlevel,
     )
 
     print_coverage_stats(results)
@@ -85,7 +130,7 @@ def coverage(input_path, output, rate_limit):
     "--input",
     "input_path",
     type=click.Path(exists=True),
-    default="data/coverage/coverage.csv",
+    default="data/coverage/coverage.parquet",
 )
 @click.option("-o", "--output-dir", type=click.Path(), default="data/images")
 @click.option(
@@ -94,6 +139,9 @@ def coverage(input_path, output, rate_limit):
 @click.option("--pitch", type=int, default=0, help="Camera pitch (-90 to 90)")
 @click.option("--rate-limit", type=float, default=0.1, help="Seconds between API calls")
 @click.option("--skip-existing/--no-skip-existing", default=True)
+@click.option(
+    "--max-workers", type=int, default=16, help="Concurrent location downloads"
+)
 @click.option(
     "--hires/--no-hires",
     default=False,
@@ -105,12 +153,41 @@ def coverage(input_path, output, rate_limit):
     default=3,
     help="Panorama zoom level for hi-res mode (0-5). 3=~2048px, 4=~4096px",
 )
+@click.option(
+    "--pano-cache-dir",
+    type=click.Path(),
+    default=None,
+    help="Keep full hi-res panoramas here (e.g. data/pano_cache) so reruns "
+    "skip downloading them. Off by default; a few MB per panorama.",
+)
+@click.option(
+    "--format",
+    "results_format",
+    type=click.Choice(["parquet", "csv"]),
+    default="parquet",
+    help="File format for download_results",
+)
 def download(
-    input_path, output_dir, headings, pitch, rate_limit, skip_existing, hires, zoom
+    input_path,
+    output_dir,
+    headings,
+    pitch,
+    rate_limit,
+    skip_existing,
+    max_workers,
+    hires,
+    zoom,
+    pano_cache_dir,
+    results_format,
 ):
     """Download Street View images for locations with coverage."""
-    coverage_df = pd.read_csv(input_path)
-    locations = coverage_df[coverage_df["has_coverage"]].copy()
+    coverage_df = read_table(input_path)
+    location_columns = [
+        c
+        for c in ("location_id", "city", "lat", "lon", "pano_id")
+        if c in coverage_df.columns
+    ]
+    locations = coverage_df.loc[coverage_df["has_coverage"], location_columns]
     click.echo(f"Downloading images for {len(locations)} locations with coverage...")
 
     heading_list = [int(h) for h in headings.split(",")]
@@ -119,6 +196,8 @@ def download(
     total_images = len(locations) * len(heading_list)
     click.echo(f"Total images to download: {total_images}")
 
+    results_path = f"{output_dir}/download_results.{results_format}"
+
     if hires:
         click.echo(f"Mode: High-resolution (zoom={zoom})")
         if "pano_id" not in locations.columns:
@@ -133,6 +212,8 @@ def download(
             pitch=pitch,
             zoom=zoom,
             skip_existing=skip_existing,
+            output_path=results_path,
+            cache_dir=pano_cache_dir,
         )
     else:
         click.echo("Mode: Standard (640x640 API)")
@@ -143,13 +224,12 @@ def download(
             pitch=pitch,
             rate_limit=rate_limit,
             skip_existing=skip_existing,
+            max_workers=max_workers,
+            output_path=results_path,
         )
 
-    successful = results["success"].sum()
+    successful = int(results["success"].to_numpy(dtype=bool).sum())
     click.echo(f"\nDownloaded: {successful}/{len(results)} images")
-
-    results_path = output_dir + "/download_results.csv"
-    results.to_csv(results_path, index=False)
     click.echo(f"Results: {results_path}")
 
 
@@ -159,12 +239,12 @@ def download(
     "--input",
     "input_path",
     type=click.Path(exists=True),
-    default="data/images/download_results.csv",
+    default="data/images/download_results.parquet",
 )
 @click.option("-o", "--output", type=click.Path(), default="data/annotation.csv")
 def annotate(input_path, output):
     """Generate annotation CSV from download results."""
-    results = pd.read_csv(input_path)
+    results = read_table(input_path)
     click.echo(f"Processing {len(results)} download results...")
 
     annotation_df = generate_annotation_csv(results, output)
@@ -183,11 +263,13 @@ def annotate(input_path, output):
 @click.option("-o", "--output", type=click.Path(), default="data/samples/map.html")
 def plot(input_path, output):
     """Create interactive map of sampled locations."""
-    locations = pd.read_csv(input_path)
+    locations = pd.read_csv(
+        input_path, usecols=["city", "lat", "lon"], dtype=CSV_DTYPES
+    )
     click.echo(f"Plotting {len(locations)} locations...")
 
-    for city in locations["city"].unique():
-        count = len(locations[locations["city"] == city])
+    city_counts = locations.groupby("city", sort=False, observed=True).size()
+    for city, count in city_counts.items():
         click.echo(f"  {city}: {count}")
 
     output_path = plot_samples(locations, output)
@@ -1,11 +1,263 @@
 """Batch operations for Street View coverage checking and image downloading."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+import requests
 from tqdm import tqdm
 
-from .streetview import StreetViewClient, download_location_hires
+from .streetview import (
+    ImageResult,
+    StreetViewClient,
+    build_session,
+    download_locations_hires,
+)
+
+# Column types for pipeline CSVs, so read_csv skips type inference and stores
+# the few distinct city names as a category. Columns not in a file are ignored.
+CSV_DTYPES = {
+    "city": "category",
+    "lat": "float64",
+    "lon": "float64",
+    "has_coverage": "bool",
+    "success": "bool",
+}
+
+COVERAGE_SCHEMA = pa.schema(
+    [
+        ("location_id", pa.string()),
+        ("city", pa.string()),
+        ("lat", pa.float64()),
+        ("lon", pa.float64()),
+        ("has_coverage", pa.bool_()),
+        ("pano_id", pa.string()),
+        ("capture_date", pa.string()),
+        ("status", pa.string()),
+    ]
+)
+
+DOWNLOAD_SCHEMA = pa.schema(
+    [
+        ("location_id", pa.string()),
+        ("city", pa.string()),
+        ("lat", pa.float64()),
+        ("lon", pa.float64()),
+        ("heading", pa.int64()),
+        ("pitch", pa.int64()),
+        ("image_path", pa.string()),
+        ("success", pa.bool_()),
+        ("error", pa.string()),
+    ]
+)
+
+
+def write_csv(df: pd.DataFrame, path: str | Path) -> None:
+    """
+    Write a DataFrame to CSV without the index using pyarrow's C writer.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Table to write
+    path : str or Path
+        Output CSV path. Parent directories are created if needed.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(path))
+
+
+def write_table(df: pd.DataFrame, path: str | Path) -> None:
+    """
+    Write a results table, choosing the format from the file suffix.
+
+    ``.parquet`` paths are written as zstd-compressed Parquet; anything else
+    is written as CSV.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Table to write
+    path : str or Path
+        Output path. Parent directories are created if needed.
+    """
+    path = Path(path)
+    if path.suffix != ".parquet":
+        write_csv(df, path)
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+
+
+def read_table(path: str | Path, columns: list[str] | None = None) -> pd.DataFrame:
+    """
+    Read a results table written by write_table.
+
+    Parameters
+    ----------
+    path : str or Path
+        Parquet or CSV file, chosen by suffix
+    columns : list[str], optional
+        Only read these columns
+
+    Returns
+    -------
+    pd.DataFrame
+        The stored table
+    """
+    path = Path(path)
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path, engine="pyarrow", columns=columns)
+    return pd.read_csv(path, usecols=columns, dtype=CSV_DTYPES)
+
+
+class ResultWriter:
+    """
+    Collect batch results chunk by chunk, optionally streaming them to disk.
+
+    With a path, each chunk is appended to a CSV or Parquet file (chosen by
+    suffix) as soon as it is written, so memory stays bounded and partial
+    results survive a crash. Without a path, chunks are kept in memory.
+    """
+
+    def __init__(self, schema: pa.Schema, path: str | Path | None = None):
+        """
+        Initialize the writer.
+
+        Parameters
+        ----------
+        schema : pa.Schema
+            Column names and types of the result table
+        path : str or Path, optional
+            Output path. Written as Parquet if the suffix is .parquet,
+            otherwise as CSV.
+        """
+        self.schema = schema
+        self.path = Path(path) if path else None
+        self._tables: list[pa.Table] = []
+        self._writer = None
+
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.path.suffix == ".parquet":
+                self._writer = pq.ParquetWriter(
+                    str(self.path), schema, compression="zstd"
+                )
+            else:
+                self._writer = pacsv.CSVWriter(str(self.path), schema)
+
+    def write(self, columns: dict) -> None:
+        """Append a chunk given as a mapping of column name to values."""
+        table = pa.table(columns, schema=self.schema)
+        if self._writer is not None:
+            self._writer.write_table(table)
+        else:
+            self._tables.append(table)
+
+    def close(self) -> None:
+        """Close the underlying file writer, if any."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def result(self) -> pd.DataFrame:
+        """Close the writer and return all written rows as a DataFrame."""
+        self.close()
+        if self.path is not None:
+            return read_table(self.path)
+        if not self._tables:
+            return self.schema.empty_table().to_pandas()
+        return pa.concat_tables(self._tables).to_pandas()
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _existing_images(output_dir: Path) -> set[str]:
+    """Return the names of JPEG files already present in output_dir."""
+    with os.scandir(output_dir) as entries:
+        return {e.name for e in entries if e.name.endswith(".jpg")}
+
+
+def _cluster_points(
+    lat: np.ndarray,
+    lon: np.ndarray,
+    radius_m: float,
+) -> np.ndarray:
+    """
+    Assign each point to a representative point within radius_m metres.
+
+    Points are placed on a sphere of Earth's radius, each scaled by its own
+    cos(latitude), and indexed with a KD-tree; at these radii the chord length
+    equals the great-circle distance, so batches spanning several cities stay
+    accurate. Walking neighbour pairs in input order, each unclaimed point claims
+    its unclaimed neighbours, so every point is within radius_m of its
+    representative and representatives keep their own index.
+
+    Returns
+    -------
+    np.ndarray
+        Index of the representative point for each input point.
+    """
+    n = len(lat)
+    reps = np.arange(n)
+    if n < 2 or radius_m <= 0:
+        return reps
+
+    lat_rad = np.radians(np.asarray(lat, dtype=np.float64))
+    lon_rad = np.radians(np.asarray(lon, dtype=np.float64))
+    cos_lat = np.cos(lat_rad)
+    xyz = 6371000 * np.column_stack(
+        [cos_lat * np.cos(lon_rad), cos_lat * np.sin(lon_rad), np.sin(lat_rad)]
+    )
+
+    from scipy.spatial import cKDTree
+
+    pairs = cKDTree(xyz).query_pairs(radius_m, output_type="ndarray")
+    pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+    for i, j in pairs.tolist():
+        if reps[i] == i and reps[j] == j:
+            reps[j] = i
+
+    return reps
+
+
+def _download_columns(
+    cols: dict[str, np.ndarray],
+    location_results: list[list[ImageResult]],
+) -> dict:
+    """
+    Build the download results columns for a chunk of locations.
+
+    Location fields are repeated once per image; image fields are read off the
+    ImageResult objects, so no per-row dicts are created.
+    """
+    counts = [len(results) for results in location_results]
+    flat = [r for results in location_results for r in results]
+
+    return {
+        "location_id": np.repeat(cols["location_id"], counts),
+        "city": np.repeat(cols["city"], counts),
+        "lat": np.repeat(cols["lat"], counts),
+        "lon": np.repeat(cols["lon"], counts),
+        "heading": [r.heading for r in flat],
+        "pitch": [r.pitch for r in flat],
+        "image_path": [r.image_path for r in flat],
+        "success": [r.success for r in flat],
+        "error": [r.error for r in flat],
+    }
 
 
 def check_coverage_batch(
@@ -13,54 +265,99 @@ def check_coverage_batch(
     output_path: str | Path | None = None,
     api_key: str | None = None,
     rate_limit: float = 0.1,
+    max_workers: int = 16,
+    session: requests.Session | None = None,
+    dedup_radius_m: float = 10.0,
+    chunk_size: int = 500,
+    use_streetlevel: bool = False,
 ) -> pd.DataFrame:
     """
     Check Street View coverage for a batch of locations.
 
+    Points closer together than dedup_radius_m resolve to the same panorama,
+    so only one representative per cluster is queried and its result is
+    copied to the other members.
+
     Parameters
     ----------
     locations : pd.DataFrame
         DataFrame with columns: location_id, lat, lon, city
     output_path : str or Path, optional
-        Path to save results CSV
+        Path to save results. Written as Parquet if the suffix is .parquet,
+        otherwise as CSV. Results are appended every chunk_size locations.
     api_key : str, optional
-        Google API key
+        Google API key. Not needed with use_streetlevel.
     rate_limit : float
-        Seconds between API calls
+        Minimum seconds between API call starts, shared across all workers
+    max_workers : int
+        Number of metadata requests kept in flight concurrently
+    session : requests.Session, optional
+        HTTP session shared by all requests in the batch
+    dedup_radius_m : float
+        Cluster radius in metres for sharing coverage results. Set to 0 to
+        query every location.
+    chunk_size : int
+        Number of locations processed and written per chunk
+    use_streetlevel : bool
+        Look up panoramas through the streetlevel library instead of the
+        metadata API
 
     Returns
     -------
     pd.DataFrame
         Input DataFrame with added columns: has_coverage, pano_id, capture_date, status
     """
-    client = StreetViewClient(api_key=api_key, rate_limit=rate_limit)
-    results = []
-
-    for _, row in tqdm(
-        locations.iterrows(), total=len(locations), desc="Checking coverage"
-    ):
-        result = client.check_coverage(row["lat"], row["lon"])
-        results.append(
-            {
-                "location_id": row["location_id"],
-                "city": row["city"],
-                "lat": row["lat"],
-                "lon": row["lon"],
-                "has_coverage": result.has_coverage,
-                "pano_id": result.pano_id,
-                "capture_date": result.capture_date,
-                "status": result.status,
-            }
-        )
-
-    df = pd.DataFrame(results)
+    client = StreetViewClient(api_key=api_key, rate_limit=rate_limit, session=session)
+    if not use_streetlevel:
+        client.require_api_key()
+
+    cols = {c: locations[c].to_numpy() for c in ("location_id", "city", "lat", "lon")}
+
+    n = len(locations)
+    reps = _cluster_points(cols["lat"], cols["lon"], dedup_radius_m)
+
+    # A representative always precedes its cluster members, so its result is
+    # cached from its own chunk until the last member has been written.
+    last_member = np.arange(n)
+    np.maximum.at(last_member, reps, np.arange(n))
+    rep_results = {}
+
+    writer = ResultWriter(COVERAGE_SCHEMA, output_path)
+
+    with client, writer, ThreadPoolExecutor(max_workers=max_workers) as pool, tqdm(
+        total=len(np.unique(reps)), desc="Checking coverage"
+    ) as progress:
+        for start in range(0, n, chunk_size):
+            stop = min(start + chunk_size, n)
+            chunk_reps = reps[start:stop]
+            new_reps = np.unique(chunk_reps[chunk_reps >= start])
+
+            for rep, result in zip(
+                new_reps.tolist(),
+                pool.map(
+                    partial(client.check_coverage, use_streetlevel=use_streetlevel),
+                    cols["lat"][new_reps],
+                    cols["lon"][new_reps],
+                ),
+            ):
+                rep_results[rep] = result
+                progress.update()
+
+            coverage = [rep_results[rep] for rep in chunk_reps.tolist()]
+            writer.write(
+                {
+                    **{c: values[start:stop] for c, values in cols.items()},
+                    "has_coverage": [r.has_coverage for r in coverage],
+                    "pano_id": [r.pano_id for r in coverage],
+                    "capture_date": [r.capture_date for r in coverage],
+                    "status": [r.status for r in coverage],
+                }
+            )
 
-    if output_path:
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_csv(output_path, index=False)
+            for rep in [r for r in rep_results if last_member[r] < stop]:
+                del rep_results[rep]
 
-    return df
+    return writer.result()
 
 
 def download_images_batch(
@@ -71,6 +368,10 @@ def download_images_batch(
     api_key: str | None = None,
     rate_limit: float = 0.1,
     skip_existing: bool = True,
+    session: requests.Session | None = None,
+    max_workers: int = 16,
+    output_path: str | Path | None = None,
+    chunk_size: int = 500,
 ) -> pd.DataFrame:
     """
     Download Street View images for a batch of locations.
@@ -92,6 +393,16 @@ def download_images_batch(
         Seconds between API calls
     skip_existing : bool
         Skip locations that already have images downloaded
+    session : requests.Session, optional
+        HTTP session shared by all requests in the batch
+    max_workers : int
+        Number of locations downloaded concurrently. The rate limit is shared
+        across workers.
+    output_path : str or Path, optional
+        Path to save results. Written as Parquet if the suffix is .parquet,
+        otherwise as CSV. Results are appended every chunk_size locations.
+    chunk_size : int
+        Number of locations processed and written per chunk
 
     Returns
     -------
@@ -99,65 +410,70 @@ def download_images_batch(
         Download results with columns: location_id, city, lat, lon, heading, pitch,
         image_path, success, error
     """
-    client = StreetViewClient(api_key=api_key, rate_limit=rate_limit)
+    client = StreetViewClient(api_key=api_key, rate_limit=rate_limit, session=session)
+    client.require_api_key()
     headings = headings or [0, 90, 180, 270]
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    all_results = []
+    existing = _existing_images(output_dir) if skip_existing else set()
+    output_str = str(output_dir)
+    suffixes = [f"_h{h:03d}_p{pitch:+03d}.jpg" for h in headings]
+
+    cols = {c: locations[c].to_numpy() for c in ("location_id", "city", "lat", "lon")}
+    # Filenames are built by string concatenation, and DOWNLOAD_SCHEMA stores
+    # location_id as a string, so integer IDs are cast up front.
+    cols["location_id"] = cols["location_id"].astype(str)
+    writer = ResultWriter(DOWNLOAD_SCHEMA, output_path)
+
+    with client, writer, ThreadPoolExecutor(max_workers=max_workers) as pool, tqdm(
+        total=len(locations), desc="Downloading images"
+    ) as progress:
+        for start in range(0, len(locations), chunk_size):
+            stop = start + chunk_size
+            chunk = {c: values[start:stop] for c, values in cols.items()}
+            location_results: list[list[ImageResult]] = [[] for _ in chunk["lat"]]
+            futures = {}
+
+            for i, (location_id, lat, lon) in enumerate(
+                zip(chunk["location_id"], chunk["lat"], chunk["lon"])
+            ):
+                if skip_existing:
+                    expected_files = [location_id + suffix for suffix in suffixes]
+                    if all(f in existing for f in expected_files):
+                        location_results[i] = [
+                            ImageResult(
+                                lat=lat,
+                                lon=lon,
+                                heading=h,
+                                pitch=pitch,
+                                success=True,
+                                image_path=os.path.join(output_str, f),
+                            )
+                            for h, f in zip(headings, expected_files)
+                        ]
+                        progress.update()
+                        continue
+
+                future = pool.submit(
+                    client.download_location_images,
+                    lat=lat,
+                    lon=lon,
+                    location_id=location_id,
+                    output_dir=output_dir,
+                    headings=headings,
+                    pitch=pitch,
+                    max_workers=1,
+                )
+                futures[future] = i
 
-    for _, row in tqdm(
-        locations.iterrows(), total=len(locations), desc="Downloading images"
-    ):
-        location_id = row["location_id"]
+            for future in as_completed(futures):
+                location_results[futures[future]] = future.result()
+                progress.update()
 
-        if skip_existing:
-            expected_files = [
-                output_dir / f"{location_id}_h{h:03d}_p{pitch:+03d}.jpg"
-                for h in headings
-            ]
-            if all(f.exists() for f in expected_files):
-                for h, f in zip(headings, expected_files):
-                    all_results.append(
-                        {
-                            "location_id": location_id,
-                            "city": row["city"],
-                            "lat": row["lat"],
-                            "lon": row["lon"],
-                            "heading": h,
-                            "pitch": pitch,
-                            "image_path": str(f),
-                            "success": True,
-                            "error": None,
-                        }
-                    )
-                continue
+            writer.write(_download_columns(chunk, location_results))
 
-        results = client.download_location_images(
-            lat=row["lat"],
-            lon=row["lon"],
-            location_id=location_id,
-            output_dir=output_dir,
-            headings=headings,
-            pitch=pitch,
-        )
-
-        for result in results:
-            all_results.append(
-                {
-                    "location_id": location_id,
-                    "city": row["city"],
-                    "lat": row["lat"],
-                    "lon": row["lon"],
-                    "heading": result.heading,
-                    "pitch": result.pitch,
-                    "image_path": result.image_path,
-                    "success": result.success,
-                    "error": result.error,
-                }
-            )
-
-    return pd.DataFrame(all_results)
+    return writer.result()
 
 
 def download_images_hires_batch(
@@ -168,12 +484,17 @@ def download_images_hires_batch(
     fov: int = 90,
     zoom: int = 3,
     skip_existing: bool = True,
+    session: requests.Session | None = None,
+    output_path: str | Path | None = None,
+    cache: bool = False,
+    cache_dir: str | Path | None = None,
 ) -> pd.DataFrame:
     """
     Download high-resolution Street View images for a batch of locations.
 
     Uses the streetlevel library to fetch full panoramas and crop them.
-    No API key required.
+    No API key required. Locations sharing a pano_id are cropped from a single
+    panorama fetch.
 
     Parameters
     ----------
@@ -192,6 +513,18 @@ def download_images_hires_batch(
         Panorama zoom level (0-5). 3 = ~2048px, 4 = ~4096px
     skip_existing : bool
         Skip locations that already have images downloaded
+    session : requests.Session, optional
+        HTTP session shared by all panorama lookups in the batch
+    output_path : str or Path, optional
+        Path to save results. Written as Parquet if the suffix is .parquet,
+        otherwise as CSV.
+    cache : bool
+        Keep recently used panoramas in memory after the batch. Off by
+        default: the batch already fetches each panorama once, so the
+        in-memory cache would only hold on to decoded panoramas.
+    cache_dir : str or Path, optional
+        Directory for an on-disk panorama cache so reruns skip panorama
+        downloads. Off by default; each full panorama takes a few MB.
 
     Returns
     -------
@@ -202,80 +535,81 @@ def download_images_hires_batch(
     headings = headings or [0, 90, 180, 270]
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
-
-    all_results = []
-
-    for _, row in tqdm(
-        locations.iterrows(), total=len(locations), desc="Downloading hi-res images"
+    session = session or build_session()
+    existing = _existing_images(output_dir) if skip_existing else set()
+    output_str = str(output_dir)
+    suffixes = [f"_h{h:03d}_p{pitch:+03d}.jpg" for h in headings]
+
+    cols = {c: locations[c].to_numpy() for c in ("location_id", "city", "lat", "lon")}
+    # Filenames are built by string concatenation, and DOWNLOAD_SCHEMA stores
+    # location_id as a string, so integer IDs are cast up front.
+    cols["location_id"] = cols["location_id"].astype(str)
+    if "pano_id" in locations.columns:
+        pano_ids = locations["pano_id"].to_numpy()
+    else:
+        pano_ids = [None] * len(locations)
+
+    location_results: list[list[ImageResult]] = [[] for _ in range(len(locations))]
+    pending: dict[str, list[int]] = {}
+
+    for i, (location_id, lat, lon, pano_id) in enumerate(
+        zip(cols["location_id"], cols["lat"], cols["lon"], pano_ids)
     ):
-        location_id = row["location_id"]
-        pano_id = row.get("pano_id")
-
         if pd.isna(pano_id) or not pano_id:
-            for h in headings:
-                all_results.append(
-                    {
-                        "location_id": location_id,
-                        "city": row["city"],
-                        "lat": row["lat"],
-                        "lon": row["lon"],
-                        "heading": h,
-                        "pitch": pitch,
-                        "image_path": None,
-                        "success": False,
-                        "error": "No pano_id available",
-                    }
+            location_results[i] = [
+                ImageResult(
+                    lat=lat,
+                    lon=lon,
+                    heading=h,
+                    pitch=pitch,
+                    success=False,
+                    error="No pano_id available",
                 )
+                for h in headings
+            ]
             continue
 
         if skip_existing:
-            expected_files = [
-                output_dir / f"{location_id}_h{h:03d}_p{pitch:+03d}.jpg"
-                for h in headings
-            ]
-            if all(f.exists() for f in expected_files):
-                for h, f in zip(headings, expected_files):
-                    all_results.append(
-                        {
-                            "location_id": location_id,
-                            "city": row["city"],
-                            "lat": row["lat"],
-                            "lon": row["lon"],
-                            "heading": h,
-                            "pitch": pitch,
-                            "image_path": str(f),
-                            "success": True,
-                            "error": None,
-                        }
+            expected_files = [location_id + suffix for suffix in suffixes]
+            if all(f in existing for f in expected_files):
+                location_results[i] = [
+                    ImageResult(
+                        lat=lat,
+                        lon=lon,
+                        heading=h,
+                        pitch=pitch,
+                        success=True,
+                        image_path=os.path.join(output_str, f),
                     )
+                    for h, f in zip(headings, expected_files)
+                ]
                 continue
 
-        results = download_location_hires(
+        pending.setdefault(pano_id, []).append(i)
+
+    for pano_id, indices in tqdm(
+        pending.items(), total=len(pending), desc="Downloading hi-res panoramas"
+    ):
+        results = download_locations_hires(
             pano_id=pano_id,
-            location_id=location_id,
+            location_ids=[cols["location_id"][i] for i in indices],
             output_dir=output_dir,
             headings=headings,
             pitch=pitch,
             fov=fov,
             zoom=zoom,
+            session=session,
+            cache=cache,
+            cache_dir=cache_dir,
         )
+        for i, location_result in zip(indices, results):
+            location_results[i] = location_result
 
-        for result in results:
-            all_results.append(
-                {
-                    "location_id": location_id,
-                    "city": row["city"],
-                    "lat": row["lat"],
-                    "lon": row["lon"],
-                    "heading": result.heading,
-                    "pitch": result.pitch,
-                    "image_path": result.image_path,
-                    "success": result.success,
-                    "error": result.error,
-                }
-            )
+    writer = ResultWriter(DOWNLOAD_SCHEMA, output_path)
+    with writer:
+        writer.write(_download_columns(cols, location_results))
 
-    return pd.DataFrame(all_results)
+    return writer.result()
 
 
 def generate_annotation_csv(
@@ -297,12 +631,7 @@ def generate_annotation_csv(
     pd.DataFrame
         Annotation-ready DataFrame
     """
-    successful = download_results[download_results["success"]].copy()
-
-    successful["annotation_id"] = [f"ann_{i:06d}" for i in range(len(successful))]
-
     columns = [
-        "annotation_id",
         "location_id",
         "city",
         "lat",
@@ -312,11 +641,19 @@ def generate_annotation_csv(
         "image_path",
     ]
 
-    annotation_df = successful[columns]
+    successful = download_results.loc[download_results["success"], columns]
 
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    annotation_df.to_csv(output_path, index=False)
+    n = len(successful)
+    annotation_ids = np.char.mod("ann_%06d", np.arange(n))
+
+    annotation_df = pd.DataFrame(
+        {
+            "annotation_id": annotation_ids,
+            **{c: successful[c].to_numpy() for c in columns},
+        }
+    )
+
+    write_csv(annotation_df, output_path)
 
     return annotation_df
 
@@ -326,10 +663,11 @@ def print_coverage_stats(coverage_df: pd.DataFrame) -> None:
     print("\nCoverage Statistics:")
     print("-" * 50)
 
-    for city in coverage_df["city"].unique():
-        city_data = coverage_df[coverage_df["city"] == city]
-        total = len(city_data)
-        with_coverage = city_data["has_coverage"].sum()
+    stats = coverage_df.groupby("city", sort=False, observed=True)["has_coverage"].agg(
+        total="size", covered="sum"
+    )
+
+    for city, total, with_coverage in stats.itertuples():
         pct = (with_coverage / total) * 100 if total > 0 else 0
         print(f"{city}: {with_coverage}/{total} ({pct:.1f}%)")
 
@@ -1,17 +1,30 @@
 """Location sampling for Indian cities using OSM Overpass API."""
 
-import random
+import math
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
 
-import folium
+import numpy as np
 import pandas as pd
-import requests
+
+from .streetview import build_session
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 DATA_DIR = Path("data")
 
 OVERPASS_URL = "https://overpass-api.de/api/interpreter"
 
+HIGHWAY_TYPES = ("primary", "secondary", "tertiary", "residential", "unclassified")
+HIGHWAY_PATTERN = f"^({'|'.join(HIGHWAY_TYPES)})$"
+
+# Shared across Overpass queries so the TLS handshake is paid once per run.
+_session = build_session()
+
 
 @dataclass
 class CityConfig:
@@ -43,14 +56,37 @@ CITY_CONFIGS = {
 }
 
 
+def _road_columns(
+    osm_ids: list[int] | np.ndarray,
+    names: list[str] | np.ndarray,
+    highways: list[str] | np.ndarray,
+    coords: list[tuple[float, float]] | np.ndarray,
+    node_road: list[int] | np.ndarray,
+) -> dict[str, np.ndarray]:
+    """
+    Pack roads as column arrays.
+
+    osm_id, name and highway hold one entry per road. coords is an (n, 2)
+    lat/lon array of every road's nodes back to back, and road gives the
+    index of the road each node belongs to.
+    """
+    return {
+        "osm_id": np.asarray(osm_ids, dtype=np.int64),
+        "name": np.asarray(names, dtype=object),
+        "highway": np.asarray(highways, dtype=object),
+        "coords": np.asarray(coords, dtype=np.float64).reshape(-1, 2),
+        "road": np.asarray(node_road, dtype=np.int64),
+    }
+
+
 def _fetch_roads_from_overpass(
     relation_id: int,
     bbox: tuple[float, float, float, float] | None = None,
-) -> list[dict]:
+) -> dict[str, np.ndarray]:
     """
     Fetch road segments from OSM Overpass API.
 
-    Returns list of road segments with coordinates.
+    Returns road columns as built by _road_columns.
     """
     if bbox:
         min_lat, min_lon, max_lat, max_lon = bbox
@@ -58,7 +94,7 @@ def _fetch_roads_from_overpass(
         query = f"""
         [out:json][timeout:180];
         (
-          way["highway"~"^(primary|secondary|tertiary|residential|unclassified)$"]({bbox_str});
+          way["highway"~"{HIGHWAY_PATTERN}"]({bbox_str});
         );
         out body;
         >;
@@ -69,7 +105,7 @@ def _fetch_roads_from_overpass(
         [out:json][timeout:180];
         area(id:{3600000000 + relation_id})->.searchArea;
         (
-          way["highway"~"^(primary|secondary|tertiary|residential|unclassified)$"](area.searchArea);
+          way["highway"~"{HIGHWAY_PATTERN}"](area.searchArea);
         );
         out body;
         >;
@@ -77,82 +113,244 @@ def _fetch_roads_from_overpass(
         """
 
     print("Fetching roads from Overpass API...")
-    response = requests.post(OVERPASS_URL, data={"data": query}, timeout=300)
+    response = _session.post(OVERPASS_URL, data={"data": query}, timeout=300)
     response.raise_for_status()
     data = response.json()
 
-    nodes = {}
+    node_ids, node_lats, node_lons = [], [], []
+    way_ids, names, highways, way_nodes = [], [], [], []
     for element in data["elements"]:
         if element["type"] == "node":
-            nodes[element["id"]] = (element["lat"], element["lon"])
+            node_ids.append(element["id"])
+            node_lats.append(element["lat"])
+            node_lons.append(element["lon"])
+        elif element["type"] == "way":
+            tags = element.get("tags", {})
+            way_ids.append(element["id"])
+            names.append(tags.get("name", ""))
+            highways.append(tags.get("highway", ""))
+            way_nodes.append(element.get("nodes", []))
+
+    # Resolve every way's node references in one binary search over the
+    # sorted node IDs; references to nodes not in the response are dropped.
+    node_ids = np.asarray(node_ids, dtype=np.int64)
+    order = np.argsort(node_ids, kind="stable")
+    sorted_ids = node_ids[order]
+    node_coords = np.column_stack((node_lats, node_lons)).reshape(-1, 2)[order]
+
+    lengths = [len(nodes) for nodes in way_nodes]
+    refs = np.fromiter(
+        chain.from_iterable(way_nodes), dtype=np.int64, count=sum(lengths)
+    )
+    ref_way = np.repeat(np.arange(len(way_nodes)), lengths)
+
+    pos = np.searchsorted(sorted_ids, refs)
+    found = pos < len(sorted_ids)
+    found[found] = sorted_ids[pos[found]] == refs[found]
+
+    # Keep ways with at least two resolved nodes, renumbered in order.
+    keep = np.bincount(ref_way[found], minlength=len(way_nodes)) >= 2
+    keep_ref = found & keep[ref_way]
+    road_of_way = np.cumsum(keep) - 1
+
+    print(f"Found {int(keep.sum())} road segments")
+    return _road_columns(
+        np.asarray(way_ids, dtype=np.int64)[keep],
+        np.asarray(names, dtype=object)[keep],
+        np.asarray(highways, dtype=object)[keep],
+        node_coords[pos[keep_ref]],
+        road_of_way[ref_way[keep_ref]],
+    )
+
+
+def _fetch_roads_pyrosm(
+    config: CityConfig,
+    pbf_path: str | Path | None = None,
+) -> dict[str, np.ndarray]:
+    """
+    Fetch road segments from an OSM PBF extract using pyrosm.
 
-    roads = []
-    for element in data["elements"]:
-        if element["type"] == "way":
-            way_nodes = element.get("nodes", [])
-            if len(way_nodes) >= 2:
-                coords = [nodes.get(n) for n in way_nodes if n in nodes]
-                if len(coords) >= 2:
-                    roads.append(
-                        {
-                            "osm_id": element["id"],
-                            "name": element.get("tags", {}).get("name", ""),
-                            "highway": element.get("tags", {}).get("highway", ""),
-                            "coords": coords,
-                        }
-                    )
-
-    print(f"Found {len(roads)} road segments")
-    return roads
-
-
-def _segment_roads(roads: list[dict], segment_length_m: float = 500) -> list[dict]:
+    The extract is parsed by pyrosm's Cython reader rather than walking
+    Overpass JSON in Python. If pbf_path is not given, pyrosm downloads the
+    extract for the city name into data/osm; cities missing from pyrosm's
+    catalogue (e.g. Navi Mumbai) need an explicit pbf_path. Requires the
+    optional ``osm`` extra.
+
+    Returns road columns as built by _road_columns.
+    """
+    try:
+        import shapely
+        from pyrosm import OSM, get_data
+    except ImportError as e:
+        raise ImportError(
+            "The pyrosm backend requires pyrosm: pip install 'gsview[osm]'"
+        ) from e
+
+    if pbf_path is None:
+        try:
+            pbf_path = get_data(config.name, directory=str(DATA_DIR / "osm"))
+        except ValueError as e:
+            raise ValueError(
+                f"pyrosm has no extract for {config.name}; "
+                "pass pbf_path with a PBF file covering the city"
+            ) from e
+
+    bounding_box = None
+    if config.bbox:
+        min_lat, min_lon, max_lat, max_lon = config.bbox
+        bounding_box = [min_lon, min_lat, max_lon, max_lat]
+
+    print(f"Reading roads from {pbf_path}...")
+    osm = OSM(str(pbf_path), bounding_box=bounding_box)
+    ways = osm.get_network(network_type="driving")
+    ways = ways[ways["highway"].isin(HIGHWAY_TYPES)]
+
+    # Each LineString part becomes one road; parts with fewer than two
+    # nodes are dropped and the remaining parts renumbered.
+    parts, way_idx = shapely.get_parts(ways.geometry.to_numpy(), return_index=True)
+    coords, part_idx = shapely.get_coordinates(parts, return_index=True)
+    keep = np.bincount(part_idx, minlength=len(parts)) >= 2
+    road_of_part = np.cumsum(keep) - 1
+    keep_node = keep[part_idx]
+    way_idx = way_idx[keep]
+
+    print(f"Found {len(way_idx)} road segments")
+    return _road_columns(
+        ways["id"].to_numpy()[way_idx],
+        ways["name"].fillna("").to_numpy()[way_idx],
+        ways["highway"].to_numpy()[way_idx],
+        coords[keep_node][:, ::-1],
+        road_of_part[part_idx[keep_node]],
+    )
+
+
+def _haversine(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray,
+) -> np.ndarray:
+    """Great-circle distance in meters between arrays of points."""
+    R = 6371000
+    phi1, phi2 = np.radians(lat1), np.radians(lat2)
+    dphi = np.radians(lat2 - lat1)
+    dlam = np.radians(lon2 - lon1)
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlam / 2) ** 2
+    return 2 * R * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def _segment_edges_numpy(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray,
+    segment_length_m: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Cut edges into segments; return (edge index, midpoint lat, midpoint lon)."""
+    distance = _haversine(lat1, lon1, lat2, lon2)
+    n_segments = np.maximum(1, (distance / segment_length_m).astype(np.int64))
+
+    edge_idx = np.repeat(np.arange(len(lat1)), n_segments)
+    first = np.repeat(np.cumsum(n_segments) - n_segments, n_segments)
+    j = np.arange(len(edge_idx)) - first
+    t = (j + 0.5) / n_segments[edge_idx]
+
+    mid_lat = lat1[edge_idx] + t * (lat2[edge_idx] - lat1[edge_idx])
+    mid_lon = lon1[edge_idx] + t * (lon2[edge_idx] - lon1[edge_idx])
+    return edge_idx, mid_lat, mid_lon
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _haversine_scalar(lat1, lon1, lat2, lon2):
+        R = 6371000.0
+        phi1, phi2 = math.radians(lat1), math.radians(lat2)
+        dphi = math.radians(lat2 - lat1)
+        dlam = math.radians(lon2 - lon1)
+        a = (
+            math.sin(dphi / 2) ** 2
+            + math.cos(phi1) * math.cos(phi2) * math.sin(dlam / 2) ** 2
+        )
+        return 2 * R * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+    @njit(cache=True)
+    def _segment_kernel(lat1, lon1, lat2, lon2, segment_length_m):
+        n_edges = lat1.shape[0]
+        n_segments = np.empty(n_edges, dtype=np.int64)
+        total = 0
+        for i in range(n_edges):
+            distance = _haversine_scalar(lat1[i], lon1[i], lat2[i], lon2[i])
+            n_segments[i] = max(1, int(distance / segment_length_m))
+            total += n_segments[i]
+
+        edge_idx = np.empty(total, dtype=np.int64)
+        mid_lat = np.empty(total, dtype=np.float64)
+        mid_lon = np.empty(total, dtype=np.float64)
+        k = 0
+        for i in range(n_edges):
+            n = n_segments[i]
+            for j in range(n):
+                t = (j + 0.5) / n
+                edge_idx[k] = i
+                mid_lat[k] = lat1[i] + t * (lat2[i] - lat1[i])
+                mid_lon[k] = lon1[i] + t * (lon2[i] - lon1[i])
+                k += 1
+        return edge_idx, mid_lat, mid_lon
+
+    _segment_edges = _segment_kernel
+else:
+    _segment_edges = _segment_edges_numpy
+
+
+def _segment_roads(
+    roads: dict[str, np.ndarray], segment_length_m: float = 500
+) -> pd.DataFrame:
     """
     Split roads into segments of approximately segment_length_m meters.
 
-    Returns list of segment midpoints.
+    Every consecutive pair of road nodes is an edge; each edge is cut into
+    max(1, int(length / segment_length_m)) equal parts. The edge math runs
+    in a compiled Numba kernel when numba is installed, and as vectorized
+    NumPy otherwise.
+
+    Returns DataFrame of segment midpoints.
     """
-    from math import atan2, cos, radians, sin, sqrt
-
-    def haversine(lat1, lon1, lat2, lon2):
-        R = 6371000
-        phi1, phi2 = radians(lat1), radians(lat2)
-        dphi = radians(lat2 - lat1)
-        dlam = radians(lon2 - lon1)
-        a = sin(dphi / 2) ** 2 + cos(phi1) * cos(phi2) * sin(dlam / 2) ** 2
-        return 2 * R * atan2(sqrt(a), sqrt(1 - a))
-
-    segments = []
-    for road in roads:
-        coords = road["coords"]
-        for i in range(len(coords) - 1):
-            lat1, lon1 = coords[i]
-            lat2, lon2 = coords[i + 1]
-
-            distance = haversine(lat1, lon1, lat2, lon2)
-            n_segments = max(1, int(distance / segment_length_m))
-
-            for j in range(n_segments):
-                t = (j + 0.5) / n_segments
-                mid_lat = lat1 + t * (lat2 - lat1)
-                mid_lon = lon1 + t * (lon2 - lon1)
-
-                segments.append(
-                    {
-                        "lat": mid_lat,
-                        "lon": mid_lon,
-                        "osm_id": road["osm_id"],
-                        "osm_name": road["name"],
-                        "osm_type": road["highway"],
-                    }
-                )
-
-    return segments
+    columns = ["lat", "lon", "osm_id", "osm_name", "osm_type"]
+    coords, node_road = roads["coords"], roads["road"]
+
+    # An edge joins consecutive nodes of the same road.
+    start = np.flatnonzero(node_road[1:] == node_road[:-1])
+    if len(start) == 0:
+        return pd.DataFrame(columns=columns)
+    edge_road = node_road[start]
+
+    lat1, lon1 = coords[start, 0], coords[start, 1]
+    lat2, lon2 = coords[start + 1, 0], coords[start + 1, 1]
+
+    edge_idx, mid_lat, mid_lon = _segment_edges(
+        lat1, lon1, lat2, lon2, float(segment_length_m)
+    )
+
+    road_idx = edge_road[edge_idx]
+
+    return pd.DataFrame(
+        {
+            "lat": mid_lat,
+            "lon": mid_lon,
+            "osm_id": roads["osm_id"][road_idx],
+            "osm_name": roads["name"][road_idx],
+            "osm_type": roads["highway"][road_idx],
+        },
+        columns=columns,
+    )
 
 
 def get_roads_for_city(
     city: str,
     force_download: bool = False,
+    backend: str = "overpass",
+    pbf_path: str | Path | None = None,
 ) -> pd.DataFrame:
     """
     Get road segments for a city.
@@ -163,6 +361,13 @@ def get_roads_for_city(
         City name: 'mumbai', 'delhi', or 'navi_mumbai'
     force_download : bool
         Re-download even if data exists
+    backend : str
+        Road source when downloading: 'overpass' (default) queries the
+        Overpass API for the city relation; 'pyrosm' parses an OSM PBF
+        extract locally
+    pbf_path : str or Path, optional
+        PBF extract for the 'pyrosm' backend. Downloaded if not given, which
+        only works for cities in pyrosm's catalogue.
 
     Returns
     -------
@@ -175,25 +380,37 @@ def get_roads_for_city(
             f"Unknown city: {city}. Choose from: {list(CITY_CONFIGS.keys())}"
         )
 
+    if backend not in ("overpass", "pyrosm"):
+        raise ValueError(f"Unknown backend: {backend}. Choose 'overpass' or 'pyrosm'")
+
     config = CITY_CONFIGS[city_key]
     roads_dir = DATA_DIR / "roads"
     roads_dir.mkdir(parents=True, exist_ok=True)
 
-    roads_path = roads_dir / f"{city_key}_roads.csv"
+    roads_path = roads_dir / f"{city_key}_roads.parquet"
+    legacy_path = roads_path.with_suffix(".csv")
 
-    if roads_path.exists() and not force_download:
-        print(f"Using existing roads data: {roads_path}")
-        return pd.read_csv(roads_path)
+    if not force_download:
+        if roads_path.exists():
+            print(f"Using existing roads data: {roads_path}")
+            return pd.read_parquet(roads_path)
+        if legacy_path.exists():
+            print(f"Using existing roads data: {legacy_path}")
+            return pd.read_csv(
+                legacy_path,
+                dtype={"lat": "float64", "lon": "float64", "osm_id": "int64"},
+            )
 
     print(f"Downloading road data for {config.name}...")
-    roads = _fetch_roads_from_overpass(config.osm_relation_id, config.bbox)
+    if backend == "pyrosm":
+        roads = _fetch_roads_pyrosm(config, pbf_path)
+    else:
+        roads = _fetch_roads_from_overpass(config.osm_relation_id, config.bbox)
 
     print("Segmenting roads...")
-    segments = _segment_roads(roads)
-
-    df = pd.DataFrame(segments)
+    df = _segment_roads(roads)
     df["segment_id"] = range(len(df))
-    df.to_csv(roads_path, index=False)
+    df.to_parquet(roads_path, index=False, compression="zstd")
     print(f"Saved {len(df)} segments to {roads_path}")
 
     return df
@@ -204,6 +421,8 @@ def sample_city(
     n_samples: int | None = None,
     seed: int | None = None,
     force_download: bool = False,
+    backend: str = "overpass",
+    pbf_path: str | Path | None = None,
 ) -> pd.DataFrame:
     """
     Sample road locations from a city.
@@ -218,6 +437,11 @@ def sample_city(
         Random seed for reproducibility.
     force_download : bool
         Re-download road data even if it exists
+    backend : str
+        Road source when downloading, 'overpass' or 'pyrosm'. See
+        get_roads_for_city.
+    pbf_path : str or Path, optional
+        PBF extract for the 'pyrosm' backend
 
     Returns
     -------
@@ -233,7 +457,9 @@ def sample_city(
     config = CITY_CONFIGS[city_key]
     n = n_samples or config.default_samples
 
-    roads_df = get_roads_for_city(city, force_download=force_download)
+    roads_df = get_roads_for_city(
+        city, force_download=force_download, backend=backend, pbf_path=pbf_path
+    )
 
     if len(roads_df) < n:
         print(
@@ -242,11 +468,10 @@ def sample_city(
         )
         n = len(roads_df)
 
-    if seed is not None:
-        random.seed(seed)
-
-    sampled = roads_df.sample(n=n, random_state=seed)
-    sampled = sampled.copy()
+    # Same draw as roads_df.sample(n=n, random_state=seed), so samples from
+    # earlier runs stay reproducible, without DataFrame.sample's overhead.
+    idx = np.random.RandomState(seed).choice(len(roads_df), size=n, replace=False)
+    sampled = roads_df.iloc[idx].copy()
     sampled["city"] = config.name
 
     return sampled[
@@ -258,6 +483,8 @@ def sample_all_cities(
     n_samples: dict[str, int] | None = None,
     seed: int | None = None,
     force_download: bool = False,
+    backend: str = "overpass",
+    pbf_paths: dict[str, str | Path] | None = None,
 ) -> pd.DataFrame:
     """
     Sample from all configured cities.
@@ -270,6 +497,11 @@ def sample_all_cities(
         Base random seed (incremented per city).
     force_download : bool
         Re-download road data even if it exists
+    backend : str
+        Road source when downloading, 'overpass' or 'pyrosm'
+    pbf_paths : dict, optional
+        PBF extract per city for the 'pyrosm' backend. Cities not listed are
+        downloaded by pyrosm if it can resolve them.
 
     Returns
     -------
@@ -277,18 +509,24 @@ def sample_all_cities(
         Combined DataFrame with all samples.
     """
     n_samples = n_samples or {}
+    pbf_paths = pbf_paths or {}
     dfs = []
 
     for i, city in enumerate(CITY_CONFIGS.keys()):
         city_seed = seed + i if seed is not None else None
         n = n_samples.get(city)
         df = sample_city(
-            city, n_samples=n, seed=city_seed, force_download=force_download
+            city,
+            n_samples=n,
+            seed=city_seed,
+            force_download=force_download,
+            backend=backend,
+            pbf_path=pbf_paths.get(city),
         )
         dfs.append(df)
 
     combined = pd.concat(dfs, ignore_index=True)
-    combined["location_id"] = [f"loc_{i:05d}" for i in range(len(combined))]
+    combined["location_id"] = np.char.mod("loc_%05d", np.arange(len(combined)))
     return combined[
         ["location_id", "city", "lat", "lon", "segment_id", "osm_name", "osm_type"]
     ]
@@ -317,26 +555,29 @@ def plot_samples(df: pd.DataFrame, output_path: str = "data/samples/map.html") -
     str
         Path to saved map file
     """
+    import folium
+
     center_lat = df["lat"].mean()
     center_lon = df["lon"].mean()
 
     m = folium.Map(location=[center_lat, center_lon], zoom_start=10)
 
-    for city in df["city"].unique():
-        city_df = df[df["city"] == city]
+    for city, city_df in df.groupby("city", sort=False, observed=True):
         color = CITY_COLORS.get(city, "#999999")
 
         fg = folium.FeatureGroup(name=city)
 
-        for _, row in city_df.iterrows():
+        for lat, lon in zip(
+            city_df["lat"].to_numpy().tolist(), city_df["lon"].to_numpy().tolist()
+        ):
             folium.CircleMarker(
-                location=[row["lat"], row["lon"]],
+                location=[lat, lon],
                 radius=3,
                 color=color,
                 fill=True,
                 fillColor=color,
                 fillOpacity=0.7,
-                popup=f"{city}: ({row['lat']:.4f}, {row['lon']:.4f})",
+                popup=f"{city}: ({lat:.4f}, {lon:.4f})",
             ).add_to(fg)
 
         fg.add_to(m)
@@ -1,20 +1,84 @@
 """Google Street View API client."""
 
+from __future__ import annotations
+
 import os
+import shutil
+import threading
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+import numpy as np
 import requests
 from dotenv import load_dotenv
-from PIL import Image
-from streetlevel import streetview as sv
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3Error
+from urllib3.util.retry import Retry
 
-load_dotenv()
+# Pillow and streetlevel are imported where they are used, so importing the
+# package (e.g. for sampling) does not pay for them.
+if TYPE_CHECKING:
+    from PIL import Image
+    from streetlevel.streetview import StreetViewPanorama
 
 METADATA_URL = "https://maps.googleapis.com/maps/api/streetview/metadata"
 IMAGE_URL = "https://maps.googleapis.com/maps/api/streetview"
 
+# Copied verbatim from streetlevel.streetview.get_panorama (streetlevel 0.12.12),
+# which does not expose them. Keep in sync when upgrading streetlevel.
+TILE_HEADERS = {
+    "Host": "streetviewpixels-pa.googleapis.com",
+    "Origin": "https://www.google.com",
+    "Referer": "https://www.google.com/",
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 11.0; Win64; x64; rv:151.0) "
+        "Gecko/20100101 Firefox/151.0"
+    ),
+}
+
+# Encoder settings for hi-res crops: quality 90 with 4:2:0 chroma subsampling
+# and no optimize or progressive passes, the fastest libjpeg configuration.
+JPEG_OPTIONS = {
+    "quality": 90,
+    "optimize": False,
+    "progressive": False,
+    "subsampling": 2,
+}
+
+
+def build_session() -> requests.Session:
+    """
+    Create an HTTP session that keeps connections alive across calls.
+
+    One session should be shared by every request in a batch so TCP and TLS
+    handshakes are paid once per connection rather than once per call.
+    Rate-limit and server errors (429, 5xx) are retried for GET and POST with
+    exponential backoff, honouring any Retry-After header.
+
+    Returns
+    -------
+    requests.Session
+        Session with a pooled, retrying adapter mounted on https://.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "POST"],
+            respect_retry_after_header=True,
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
 
 @dataclass
 class CoverageResult:
@@ -48,6 +112,7 @@ class StreetViewClient:
         self,
         api_key: str | None = None,
         rate_limit: float = 0.1,
+        session: requests.Session | None = None,
     ):
         """
         Initialize the client.
@@ -56,27 +121,62 @@ class StreetViewClient:
         ----------
         api_key : str, optional
             Google API key. If not provided, reads from
-            GOOGLE_STREETVIEW_API_KEY env var.
+            GOOGLE_STREETVIEW_API_KEY env var, loading .env only if the
+            variable is not already set. Only the metadata and image API
+            calls need a key; streetlevel lookups work without one.
         rate_limit : float
             Minimum seconds between API calls.
+        session : requests.Session, optional
+            HTTP session to reuse. A pooled session is created if not provided
+            and closed by :meth:`close`; a caller's session is left open.
         """
+        if not api_key and not os.getenv("GOOGLE_STREETVIEW_API_KEY"):
+            load_dotenv()
         self.api_key = api_key or os.getenv("GOOGLE_STREETVIEW_API_KEY")
+        self.rate_limit = rate_limit
+        self._owns_session = session is None
+        self.session = session or build_session()
+        self._next_request_time = 0.0
+        self._rate_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the HTTP session if this client created it."""
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> "StreetViewClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def require_api_key(self) -> str:
+        """Return the API key, raising if the client was created without one."""
         if not self.api_key:
             raise ValueError(
                 "API key required. Set GOOGLE_STREETVIEW_API_KEY env var "
                 "or pass api_key."
             )
-        self.rate_limit = rate_limit
-        self._last_request_time = 0.0
+        return self.api_key
 
     def _wait_for_rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit:
-            time.sleep(self.rate_limit - elapsed)
-        self._last_request_time = time.time()
+        """
+        Enforce rate limiting between requests.
 
-    def check_coverage(self, lat: float, lon: float) -> CoverageResult:
+        Thread-safe: each caller reserves the next free slot under a lock and
+        sleeps outside it, so concurrent requests overlap while their start
+        times stay at least ``rate_limit`` seconds apart.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_time)
+            self._next_request_time = start + self.rate_limit
+        if start > now:
+            time.sleep(start - now)
+
+    def check_coverage(
+        self, lat: float, lon: float, use_streetlevel: bool = False
+    ) -> CoverageResult:
         """
         Check if Street View coverage exists at a location.
 
@@ -88,20 +188,41 @@ class StreetViewClient:
             Latitude
         lon : float
             Longitude
+        use_streetlevel : bool
+            Look up the nearest panorama through the streetlevel library
+            instead of the metadata API. Uses no API quota.
 
         Returns
         -------
         CoverageResult
             Coverage information including pano_id and capture_date if available.
         """
+        if not use_streetlevel:
+            self.require_api_key()
         self._wait_for_rate_limit()
 
+        if use_streetlevel:
+            from streetlevel import streetview as sv
+
+            pano = sv.find_panorama(lat, lon, radius=50, session=self.session)
+            if pano is None:
+                return CoverageResult(
+                    lat=lat, lon=lon, has_coverage=False, status="ZERO_RESULTS"
+                )
+            return CoverageResult(
+                lat=lat,
+                lon=lon,
+                has_coverage=True,
+                pano_id=pano.id,
+                capture_date=str(pano.date) if pano.date else None,
+            )
+
         params = {
             "location": f"{lat},{lon}",
             "key": self.api_key,
         }
 
-        response = requests.get(METADATA_URL, params=params, timeout=30)
+        response = self.session.get(METADATA_URL, params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
 
@@ -154,6 +275,7 @@ class StreetViewClient:
         ImageResult
             Download result with success status.
         """
+        api_key = self.require_api_key()
         self._wait_for_rate_limit()
 
         params = {
@@ -162,29 +284,39 @@ class StreetViewClient:
             "pitch": pitch,
             "fov": fov,
             "size": size,
-            "key": self.api_key,
+            "key": api_key,
         }
 
-        try:
-            response = requests.get(IMAGE_URL, params=params, timeout=60)
-            response.raise_for_status()
+        output_path = Path(output_path)
+        # Stream into a sibling temp file so an interrupted body never leaves a
+        # truncated .jpg that skip_existing would later count as downloaded.
+        tmp_path = output_path.with_name(output_path.name + ".part")
 
-            content_type = response.headers.get("Content-Type", "")
-            if "image" not in content_type:
-                return ImageResult(
-                    lat=lat,
-                    lon=lon,
-                    heading=heading,
-                    pitch=pitch,
-                    success=False,
-                    error=f"Unexpected content type: {content_type}",
-                )
+        try:
+            with self.session.get(
+                IMAGE_URL, params=params, timeout=60, stream=True
+            ) as response:
+                response.raise_for_status()
+
+                content_type = response.headers.get("Content-Type", "")
+                if "image" not in content_type:
+                    return ImageResult(
+                        lat=lat,
+                        lon=lon,
+                        heading=heading,
+                        pitch=pitch,
+                        success=False,
+                        error=f"Unexpected content type: {content_type}",
+                    )
 
-            output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+                output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(output_path, "wb") as f:
-                f.write(response.content)
+                # Copy the body straight from the socket to disk in chunks.
+                # Reading response.raw raises urllib3 errors, not requests ones.
+                response.raw.decode_content = True
+                with open(tmp_path, "wb") as f:
+                    shutil.copyfileobj(response.raw, f, length=64 * 1024)
+                os.replace(tmp_path, output_path)
 
             return ImageResult(
                 lat=lat,
@@ -195,7 +327,8 @@ class StreetViewClient:
                 image_path=str(output_path),
             )
 
-        except requests.RequestException as e:
+        except (requests.RequestException, Urllib3Error, OSError) as e:
+            tmp_path.unlink(missing_ok=True)
             return ImageResult(
                 lat=lat,
                 lon=lon,
@@ -213,6 +346,7 @@ class StreetViewClient:
         output_dir: str | Path,
         headings: list[int] | None = None,
         pitch: int = 0,
+        max_workers: int = 4,
     ) -> list[ImageResult]:
         """
         Download images for a location at multiple headings.
@@ -231,6 +365,9 @@ class StreetViewClient:
             List of headings. Defaults to [0, 90, 180, 270].
         pitch : int
             Camera pitch for all images.
+        max_workers : int
+            Headings downloaded concurrently. Use 1 when locations are
+            already being downloaded in parallel.
 
         Returns
         -------
@@ -239,21 +376,63 @@ class StreetViewClient:
         """
         headings = headings or [0, 90, 180, 270]
         output_dir = Path(output_dir)
-        results = []
 
-        for heading in headings:
-            filename = f"{location_id}_h{heading:03d}_p{pitch:+03d}.jpg"
-            output_path = output_dir / filename
-            result = self.download_image(
+        return self.download_many(
+            [
+                (
+                    lat,
+                    lon,
+                    heading,
+                    output_dir / f"{location_id}_h{heading:03d}_p{pitch:+03d}.jpg",
+                )
+                for heading in headings
+            ],
+            pitch=pitch,
+            max_workers=max_workers,
+        )
+
+    def download_many(
+        self,
+        tasks: list[tuple[float, float, int, str | Path]],
+        pitch: int = 0,
+        max_workers: int = 8,
+    ) -> list[ImageResult]:
+        """
+        Download many images concurrently.
+
+        Requests overlap their network round-trips while the shared rate
+        limiter keeps start times at least ``rate_limit`` seconds apart.
+
+        Parameters
+        ----------
+        tasks : list[tuple[float, float, int, str or Path]]
+            (lat, lon, heading, output_path) for each image.
+        pitch : int
+            Camera pitch for all images.
+        max_workers : int
+            Maximum concurrent downloads.
+
+        Returns
+        -------
+        list[ImageResult]
+            Results in the same order as ``tasks``.
+        """
+
+        def download(task: tuple[float, float, int, str | Path]) -> ImageResult:
+            lat, lon, heading, output_path = task
+            return self.download_image(
                 lat=lat,
                 lon=lon,
                 heading=heading,
                 output_path=output_path,
                 pitch=pitch,
             )
-            results.append(result)
 
-        return results
+        if max_workers <= 1 or len(tasks) <= 1:
+            return [download(task) for task in tasks]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as pool:
+            return list(pool.map(download, tasks))
 
 
 def download_panorama_hires(
@@ -263,12 +442,16 @@ def download_panorama_hires(
     pitch: int = 0,
     fov: int = 90,
     zoom: int = 3,
+    session: requests.Session | None = None,
+    cache: bool = True,
+    cache_dir: str | Path | None = None,
 ) -> ImageResult:
     """
     Download a high-resolution Street View image using streetlevel library.
 
-    This fetches the full panorama and crops it to the specified heading/pitch/fov.
-    No API key required (uses internal Google APIs).
+    Only the panorama tiles under the requested view are downloaded, unless
+    the full panorama is already cached. No API key required
+    (uses internal Google APIs).
 
     Parameters
     ----------
@@ -285,6 +468,13 @@ def download_panorama_hires(
     zoom : int
         Panorama zoom level (0-5). Higher = more detail.
         3 = ~2048px output, 4 = ~4096px output
+    session : requests.Session, optional
+        HTTP session to reuse for the panorama lookup
+    cache : bool
+        Keep recently used panoramas in memory
+    cache_dir : str or Path, optional
+        Directory for an on-disk panorama cache. Off by default; each full
+        panorama takes a few MB.
 
     Returns
     -------
@@ -294,32 +484,12 @@ def download_panorama_hires(
     output_path = Path(output_path)
 
     try:
-        pano = sv.find_panorama_by_id(pano_id)
-        if pano is None:
-            return ImageResult(
-                lat=0.0,
-                lon=0.0,
-                heading=heading,
-                pitch=pitch,
-                success=False,
-                error=f"Panorama not found: {pano_id}",
-            )
-
-        pano_img = sv.get_panorama(pano, zoom=zoom)
-        if pano_img is None:
-            return ImageResult(
-                lat=pano.lat,
-                lon=pano.lon,
-                heading=heading,
-                pitch=pitch,
-                success=False,
-                error="Failed to download panorama",
-            )
-
-        cropped = _crop_panorama(pano_img, heading, pitch, fov)
+        pano, cropped = _get_panorama_view(
+            pano_id, heading, pitch, fov, zoom, session, cache, cache_dir
+        )
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        cropped.save(output_path, "JPEG", quality=95)
+        cropped.save(output_path, "JPEG", **JPEG_OPTIONS)
 
         return ImageResult(
             lat=pano.lat,
@@ -341,6 +511,239 @@ def download_panorama_hires(
         )
 
 
+def _find_panorama(
+    pano_id: str, session: requests.Session | None = None
+) -> StreetViewPanorama:
+    """
+    Look up panorama metadata by ID.
+
+    Raises
+    ------
+    LookupError
+        If the panorama cannot be found.
+    """
+    from streetlevel import streetview as sv
+
+    pano = sv.find_panorama_by_id(pano_id, session=session)
+    if pano is None:
+        raise LookupError(f"Panorama not found: {pano_id}")
+    return pano
+
+
+def _load_panorama(
+    pano: StreetViewPanorama,
+    zoom: int,
+    cache_dir: str | Path | None = None,
+) -> Image.Image:
+    """
+    Load the full equirectangular image of a panorama.
+
+    If cache_dir is given, the image is read from
+    ``{cache_dir}/{pano_id}_z{zoom}.jpg`` when present and written there after
+    a download, so reruns skip the tile download.
+
+    Raises
+    ------
+    LookupError
+        If the panorama cannot be downloaded.
+    """
+    from PIL import Image
+    from streetlevel import streetview as sv
+
+    cache_path = Path(cache_dir) / f"{pano.id}_z{zoom}.jpg" if cache_dir else None
+    if cache_path is not None and cache_path.exists():
+        with Image.open(cache_path) as cached:
+            return cached.convert("RGB")
+
+    pano_img = sv.get_panorama(pano, zoom=zoom)
+    if pano_img is None:
+        raise LookupError("Failed to download panorama")
+
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        pano_img.save(tmp_path, "JPEG", quality=95)
+        os.replace(tmp_path, cache_path)
+
+    return pano_img
+
+
+@dataclass
+class _CachedPanorama:
+    """A panorama with its full equirect, or the encoded tiles fetched so far."""
+
+    pano: StreetViewPanorama
+    image: Image.Image | None = None
+    tiles: dict[tuple[int, int], bytes] = field(default_factory=dict)
+
+
+# Panoramas are ~25 MB decoded at zoom 3, so only the most recent few are kept
+# in memory. Single views only keep their JPEG tiles, a few hundred KB each.
+# Keyed by (pano_id, zoom); failures raise and are never cached.
+PANO_MEMORY_CACHE_SIZE = 8
+_pano_memory: OrderedDict[tuple[str, int], _CachedPanorama] = OrderedDict()
+_pano_memory_lock = threading.Lock()
+
+
+def _memory_get(key: tuple[str, int]) -> _CachedPanorama | None:
+    with _pano_memory_lock:
+        entry = _pano_memory.get(key)
+        if entry is not None:
+            _pano_memory.move_to_end(key)
+        return entry
+
+
+def _memory_put(key: tuple[str, int], entry: _CachedPanorama) -> None:
+    with _pano_memory_lock:
+        _pano_memory[key] = entry
+        _pano_memory.move_to_end(key)
+        while len(_pano_memory) > PANO_MEMORY_CACHE_SIZE:
+            _pano_memory.popitem(last=False)
+
+
+def _get_panorama(
+    pano_id: str,
+    zoom: int,
+    session: requests.Session | None = None,
+    cache: bool = True,
+    cache_dir: str | Path | None = None,
+) -> tuple[StreetViewPanorama, Image.Image]:
+    """
+    Fetch a panorama and its full equirectangular image.
+
+    With cache, recently used panoramas are served from memory and the
+    session is only used on a miss. cache_dir additionally enables the
+    on-disk cache described in _load_panorama.
+    """
+    key = (pano_id, zoom)
+    entry = _memory_get(key) if cache else None
+    if entry is not None and entry.image is not None:
+        return entry.pano, entry.image
+
+    pano = entry.pano if entry is not None else _find_panorama(pano_id, session)
+    pano_img = _load_panorama(pano, zoom, cache_dir)
+
+    if cache:
+        _memory_put(key, _CachedPanorama(pano, pano_img))
+    return pano, pano_img
+
+
+def _get_panorama_view(
+    pano_id: str,
+    heading: int,
+    pitch: int,
+    fov: int,
+    zoom: int,
+    session: requests.Session | None = None,
+    cache: bool = True,
+    cache_dir: str | Path | None = None,
+) -> tuple[StreetViewPanorama, Image.Image]:
+    """
+    Fetch a panorama and crop one view from it.
+
+    A fully cached panorama (in memory or in cache_dir) is cropped directly.
+    Otherwise only the tiles under the view are downloaded and stitched into
+    an image the size of the view, which holds the same pixels _crop_panorama
+    would cut from the full panorama. With cache, the lookup and the encoded
+    tiles are kept in memory for other views of the same panorama.
+    Third-party panoramas are not tiled and are downloaded whole.
+    """
+    from io import BytesIO
+
+    from PIL import Image
+    from streetlevel.streetview.streetview import _generate_tile_list
+    from streetlevel.util import download_tiles
+
+    key = (pano_id, zoom)
+    entry = _memory_get(key) if cache else None
+    if entry is not None and entry.image is not None:
+        return entry.pano, _crop_panorama(entry.image, heading, pitch, fov)
+    if cache_dir and (Path(cache_dir) / f"{pano_id}_z{zoom}.jpg").exists():
+        pano, pano_img = _get_panorama(pano_id, zoom, session, cache, cache_dir)
+        return pano, _crop_panorama(pano_img, heading, pitch, fov)
+
+    if entry is None:
+        entry = _CachedPanorama(_find_panorama(pano_id, session))
+    pano = entry.pano
+    if pano.is_third_party or not pano.image_sizes:
+        entry.image = _load_panorama(pano, zoom, cache_dir)
+        if cache:
+            _memory_put(key, entry)
+        return pano, _crop_panorama(entry.image, heading, pitch, fov)
+
+    tile_zoom = max(0, min(zoom, len(pano.image_sizes) - 1))
+    w, h = pano.image_sizes[tile_zoom].x, pano.image_sizes[tile_zoom].y
+    tile_w, tile_h = pano.tile_size.x, pano.tile_size.y
+
+    left, right, top, bottom = _crop_window(w, h, heading, pitch, fov)
+    spans = _window_spans(w, left, right)
+    ys = range(top // tile_h, (bottom - 1) // tile_h + 1)
+    columns = [range(x0 // tile_w, (x1 - 1) // tile_w + 1) for x0, x1 in spans]
+
+    missing = {(x, y) for xs in columns for x in xs for y in ys} - entry.tiles.keys()
+    if missing:
+        # _generate_tile_list is private to streetlevel but is what
+        # get_panorama uses to build tile URLs, so the URLs stay in step with
+        # the installed version; only the tiles under the view are kept.
+        tiles = [
+            t for t in _generate_tile_list(pano, tile_zoom) if (t.x, t.y) in missing
+        ]
+        fetched = download_tiles(tiles, headers=TILE_HEADERS)
+        with _pano_memory_lock:
+            entry.tiles.update(fetched)
+    if cache:
+        _memory_put(key, entry)
+
+    # Stitch each span from its tiles, then trim it to the view in the
+    # stitched image's own coordinates.
+    strips = []
+    for (x0, x1), xs in zip(spans, columns):
+        strip = Image.new("RGB", (len(xs) * tile_w, len(ys) * tile_h))
+        origin_x, origin_y = xs.start * tile_w, ys.start * tile_h
+        for x in xs:
+            for y in ys:
+                with Image.open(BytesIO(entry.tiles[x, y])) as tile:
+                    strip.paste(tile, (x * tile_w - origin_x, y * tile_h - origin_y))
+        window = (x0 - origin_x, top - origin_y, x1 - origin_x, bottom - origin_y)
+        strips.append(strip.crop(window))
+    return pano, _join_strips(strips)
+
+
+def _crop_window(
+    w: int,
+    h: int,
+    heading: int,
+    pitch: int,
+    fov: int,
+) -> tuple[int, int, int, int]:
+    """
+    Pixel bounds (left, right, top, bottom) of a view in a w x h panorama.
+
+    left may be negative and right may exceed w when the view crosses the
+    0/360 seam.
+    """
+    if pitch == 0 and fov == 90 and heading in (0, 90, 180, 270):
+        # Default views: a quarter-width square on the horizon, computed in
+        # integer arithmetic. Only heading 0 straddles the seam.
+        half = w // 8
+        center_x = heading * w // 360 % w
+        top, bottom = max(0, h // 2 - half), min(h, h // 2 + half)
+        return center_x - half, center_x + half, top, bottom
+
+    center_x = int((heading / 360.0) * w) % w
+
+    center_y = int(h / 2 - (pitch / 180.0) * h)
+
+    crop_w = int((fov / 360.0) * w)
+    crop_h = crop_w
+
+    left = center_x - crop_w // 2
+    right = center_x + crop_w // 2
+    top = max(0, center_y - crop_h // 2)
+    bottom = min(h, center_y + crop_h // 2)
+    return left, right, top, bottom
+
+
 def _crop_panorama(
     img: Image.Image,
     heading: int,
@@ -350,6 +753,10 @@ def _crop_panorama(
     """
     Crop an equirectangular panorama to a specific heading/pitch/fov.
 
+    Crops inside the image are a plain PIL crop. Crops that cross the 0/360
+    seam are cropped as two strips and joined in a single concatenate, so
+    only the view itself is ever converted to an array.
+
     Parameters
     ----------
     img : PIL.Image
@@ -367,33 +774,28 @@ def _crop_panorama(
         Cropped image
     """
     w, h = img.size
+    left, right, top, bottom = _crop_window(w, h, heading, pitch, fov)
+    return _join_strips(
+        [img.crop((x0, top, x1, bottom)) for x0, x1 in _window_spans(w, left, right)]
+    )
 
-    center_x = int((heading / 360.0) * w) % w
 
-    center_y = int(h / 2 - (pitch / 180.0) * h)
+def _window_spans(w: int, left: int, right: int) -> list[tuple[int, int]]:
+    """Split a view's column range at the 0/360 seam into in-image spans."""
+    if left < 0:
+        return [(w + left, w), (0, right)]
+    if right > w:
+        return [(left, w), (0, right - w)]
+    return [(left, right)]
 
-    crop_w = int((fov / 360.0) * w)
-    crop_h = crop_w
 
-    left = center_x - crop_w // 2
-    right = center_x + crop_w // 2
-    top = max(0, center_y - crop_h // 2)
-    bottom = min(h, center_y + crop_h // 2)
-
-    if left < 0 or right > w:
-        if left < 0:
-            left_part = img.crop((w + left, top, w, bottom))
-            right_part = img.crop((0, top, right, bottom))
-        else:
-            left_part = img.crop((left, top, w, bottom))
-            right_part = img.crop((0, top, right - w, bottom))
-
-        result = Image.new("RGB", (crop_w, bottom - top))
-        result.paste(left_part, (0, 0))
-        result.paste(right_part, (left_part.width, 0))
-        return result
+def _join_strips(strips: list[Image.Image]) -> Image.Image:
+    """Join image strips side by side, converting only when there are two."""
+    from PIL import Image
 
-    return img.crop((left, top, right, bottom))
+    if len(strips) == 1:
+        return strips[0]
+    return Image.fromarray(np.concatenate([np.asarray(s) for s in strips], axis=1))
 
 
 def download_location_hires(
@@ -404,6 +806,9 @@ def download_location_hires(
     pitch: int = 0,
     fov: int = 90,
     zoom: int = 3,
+    session: requests.Session | None = None,
+    cache: bool = True,
+    cache_dir: str | Path | None = None,
 ) -> list[ImageResult]:
     """
     Download high-resolution images for a location at multiple headings.
@@ -424,93 +829,143 @@ def download_location_hires(
         Field of view in degrees
     zoom : int
         Panorama zoom level (0-5)
+    session : requests.Session, optional
+        HTTP session to reuse for the panorama lookup
+    cache : bool
+        Keep recently used panoramas in memory
+    cache_dir : str or Path, optional
+        Directory for an on-disk panorama cache. Off by default; each full
+        panorama takes a few MB.
 
     Returns
     -------
     list[ImageResult]
         Results for each heading.
     """
-    headings = headings or [0, 90, 180, 270]
-    output_dir = Path(output_dir)
-    results = []
+    return download_locations_hires(
+        pano_id=pano_id,
+        location_ids=[location_id],
+        output_dir=output_dir,
+        headings=headings,
+        pitch=pitch,
+        fov=fov,
+        zoom=zoom,
+        session=session,
+        cache=cache,
+        cache_dir=cache_dir,
+    )[0]
+
+
+def download_locations_hires(
+    pano_id: str,
+    location_ids: list[str],
+    output_dir: str | Path,
+    headings: list[int] | None = None,
+    pitch: int = 0,
+    fov: int = 90,
+    zoom: int = 3,
+    session: requests.Session | None = None,
+    cache: bool = True,
+    cache_dir: str | Path | None = None,
+) -> list[list[ImageResult]]:
+    """
+    Download high-resolution images for locations that share one panorama.
 
-    pano = None
-    pano_img = None
+    Nearby sample points often snap to the same panorama. The panorama is
+    fetched once and cropped for every location, instead of once per location.
 
-    try:
-        pano = sv.find_panorama_by_id(pano_id)
-        if pano is None:
-            for heading in headings:
-                results.append(
-                    ImageResult(
-                        lat=0.0,
-                        lon=0.0,
-                        heading=heading,
-                        pitch=pitch,
-                        success=False,
-                        error=f"Panorama not found: {pano_id}",
-                    )
-                )
-            return results
-
-        pano_img = sv.get_panorama(pano, zoom=zoom)
-        if pano_img is None:
-            for heading in headings:
-                results.append(
-                    ImageResult(
-                        lat=pano.lat,
-                        lon=pano.lon,
-                        heading=heading,
-                        pitch=pitch,
-                        success=False,
-                        error="Failed to download panorama",
-                    )
-                )
-            return results
+    Parameters
+    ----------
+    pano_id : str
+        Panorama ID shared by all locations
+    location_ids : list[str]
+        Location identifiers for filenames
+    output_dir : str or Path
+        Directory to save images
+    headings : list[int], optional
+        List of headings. Defaults to [0, 90, 180, 270].
+    pitch : int
+        Camera pitch for all images
+    fov : int
+        Field of view in degrees
+    zoom : int
+        Panorama zoom level (0-5)
+    session : requests.Session, optional
+        HTTP session to reuse for the panorama lookup
+    cache : bool
+        Keep recently used panoramas in memory
+    cache_dir : str or Path, optional
+        Directory for an on-disk panorama cache. Off by default; each full
+        panorama takes a few MB.
 
-    except Exception as e:
-        for heading in headings:
-            results.append(
+    Returns
+    -------
+    list[list[ImageResult]]
+        Results for each heading, one list per location in location_ids.
+    """
+    headings = headings or [0, 90, 180, 270]
+    output_dir = Path(output_dir)
+
+    def failed(lat: float, lon: float, error: str) -> list[list[ImageResult]]:
+        return [
+            [
                 ImageResult(
-                    lat=0.0,
-                    lon=0.0,
+                    lat=lat,
+                    lon=lon,
                     heading=heading,
                     pitch=pitch,
                     success=False,
-                    error=str(e),
+                    error=error,
                 )
-            )
-        return results
+                for heading in headings
+            ]
+            for _ in location_ids
+        ]
 
-    for heading in headings:
+    try:
+        pano, pano_img = _get_panorama(pano_id, zoom, session, cache, cache_dir)
+    except Exception as e:
+        return failed(0.0, 0.0, str(e))
+
+    def crop_and_save(location_id: str, heading: int) -> ImageResult:
         filename = f"{location_id}_h{heading:03d}_p{pitch:+03d}.jpg"
         output_path = output_dir / filename
 
         try:
             cropped = _crop_panorama(pano_img, heading, pitch, fov)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            cropped.save(output_path, "JPEG", quality=95)
+            cropped.save(output_path, "JPEG", **JPEG_OPTIONS)
 
-            results.append(
-                ImageResult(
-                    lat=pano.lat,
-                    lon=pano.lon,
-                    heading=heading,
-                    pitch=pitch,
-                    success=True,
-                    image_path=str(output_path),
-                )
+            return ImageResult(
+                lat=pano.lat,
+                lon=pano.lon,
+                heading=heading,
+                pitch=pitch,
+                success=True,
+                image_path=str(output_path),
             )
         except Exception as e:
-            results.append(
-                ImageResult(
-                    lat=pano.lat,
-                    lon=pano.lon,
-                    heading=heading,
-                    pitch=pitch,
-                    success=False,
-                    error=str(e),
-                )
+            return ImageResult(
+                lat=pano.lat,
+                lon=pano.lon,
+                heading=heading,
+                pitch=pitch,
+                success=False,
+                error=str(e),
             )
 
-    return results
+    tasks = [
+        (location_id, heading) for location_id in location_ids for heading in headings
+    ]
+
+    # Each crop copies only its view and Pillow releases the GIL while encoding
+    # JPEGs, so threads scale across cores without pickling the panorama.
+    if len(tasks) > 1:
+        workers = min(len(tasks), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            flat = list(pool.map(crop_and_save, *zip(*tasks)))
+    else:
+        flat = [crop_and_save(*task) for task in tasks]
+
+    n = len(headings)
+    return [flat[k * n : (k + 1) * n] for k in range(len(location_ids))]